@@ -24,17 +24,28 @@ def _get_twilio_client():
         )
     return _twilio_client
 
-# Synchronous Redis helper for tools
-def _push_to_redis_queue_sync(call_id: str, text: str):
-    try:
-        r = redis.from_url(
+# Synchronous Redis client for tools (lazy init, reused across calls —
+# from_url per push rebuilt the connection pool every time)
+_redis_sync = None
+
+def _get_redis_sync():
+    global _redis_sync
+    if _redis_sync is None:
+        _redis_sync = redis.from_url(
             os.getenv("REDIS_URL", "redis://localhost:6379"),
             password=os.getenv("REDIS_PASSWORD", None),
             decode_responses=True
         )
+    return _redis_sync
+
+def _push_to_redis_queue_sync(call_id: str, text: str):
+    try:
         key = f"call_queue:{call_id}"
-        r.rpush(key, text)
-        r.expire(key, 3600)
+        # Pipeline the push + expiry into one round-trip
+        with _get_redis_sync().pipeline(transaction=False) as pipe:
+            pipe.rpush(key, text)
+            pipe.expire(key, 3600)
+            pipe.execute()
     except Exception as e:
         logger.error(f"Redis push failed: {e}")
 
@@ -91,7 +102,6 @@ def initiate_call(vendor: Dict[str, Any], trip_context: Dict[str, Any], use_real
     
     # Generate greeting audio file before call starts
     if use_real_twilio:
-        from agents.shared.audio_utils import generate_and_store_sarvam_audio
         greeting_url = generate_and_store_sarvam_audio(call_id, greeting_text, agent_gender)
         call_state["greeting_audio_url"] = greeting_url
         logger.info(f"🎵 Pre-generated greeting: {greeting_url}")
@@ -159,7 +169,10 @@ def send_message(call_id: str, message: str, offer: Optional[float] = None) -> D
     if not call:
         return {"error": "Invalid call_id or call expired"}
     call["round"] += 1
-    call["history"].append({"agent": message, "offer": offer})
+    # Each turn carries its round so no two turns are ever equal —
+    # ArrayUnion deduplicates identical elements, which would silently
+    # drop a repeated message/offer from the transcript otherwise.
+    call["history"].append({"round": call["round"], "agent": message, "offer": offer})
     
     logger.info(f"🗣️ Agent: {message}")
     
@@ -171,11 +184,19 @@ def send_message(call_id: str, message: str, offer: Optional[float] = None) -> D
         call["current_quote"] *= 0.92
         vendor_msg = f"Best I can do is ₹{call['current_quote']}"
     
-    call["history"].append({"vendor": vendor_msg})
+    call["history"].append({"round": call["round"], "vendor": vendor_msg})
     logger.info(f"👤 Vendor: {vendor_msg}")
-    
-    _save_call_state(call_id, call)
-    
+
+    # Persist only what this turn changed. The vendor block, greeting
+    # URLs etc. are immutable after initiate_call, and ArrayUnion appends
+    # the new turns server-side instead of rewriting the whole history
+    # every round.
+    _save_call_state(call_id, {
+        "round": call["round"],
+        "current_quote": call["current_quote"],
+        "history": firestore.ArrayUnion(call["history"][-2:]),
+    })
+
     return {
         "call_id": call_id,
         "vendor_response": vendor_msg,
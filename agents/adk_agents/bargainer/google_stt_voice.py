@@ -4,7 +4,7 @@ Hybrid: Sarvam TTS + Google STT (Production Ready)
 import os
 import asyncio
 import base64
-import json
+from agents.shared import fastjson
 import subprocess
 from typing import Optional
 from loguru import logger
@@ -92,7 +92,7 @@ class GoogleSTTVoice:
                 "streamSid": self.twilio_ws["streamSid"],
                 "media": {"payload": base64.b64encode(mulaw_audio).decode()}
             }
-            await self.twilio_ws["websocket"].send_text(json.dumps(media_msg))
+            await self.twilio_ws["websocket"].send_text(fastjson.dumps(media_msg))
             logger.info(f"[{self.call_id}] 📤 Sent {len(mulaw_audio)} bytes to Twilio")
         else:
             logger.error(f"[{self.call_id}] ❌ No audio or no WebSocket!")
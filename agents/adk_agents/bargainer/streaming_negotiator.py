@@ -86,15 +86,17 @@ async def run_streaming_negotiation(call_id: str, voice_stream):
             
             history.append({"role": "assistant", "content": agent_response})
             
-            # Save state
-            doc_ref.set({
-                "history": history,
-                "round": round_num,
-                "last_update": asyncio.get_event_loop().time()
-            }, merge=True)
-            
-            # Speak response
-            await voice_stream.speak(agent_response)
+            # Save state and speak concurrently: the two are independent,
+            # and to_thread keeps the blocking Firestore write off the
+            # event loop while the TTS audio streams out.
+            await asyncio.gather(
+                asyncio.to_thread(doc_ref.set, {
+                    "history": history,
+                    "round": round_num,
+                    "last_update": asyncio.get_event_loop().time()
+                }, merge=True),
+                voice_stream.speak(agent_response),
+            )
             
             # Check if agent decided to end the call
             end_signals = [
@@ -4,7 +4,7 @@ Real-time voice streaming using Sarvam AI + Twilio Media Streams
 import os
 import asyncio
 import base64
-import json
+from agents.shared import fastjson
 import subprocess
 from typing import Optional
 from loguru import logger
@@ -117,7 +117,7 @@ class StreamingVoice:
                                 "payload": base64.b64encode(mulaw_audio).decode()
                             }
                         }
-                        await self.twilio_ws["websocket"].send_text(json.dumps(media_msg))
+                        await self.twilio_ws["websocket"].send_text(fastjson.dumps(media_msg))
                         logger.info(f"[{self.call_id}] 📤 Sent {len(mulaw_audio)} bytes mulaw audio")
                     
                     self.listening = True
@@ -9,6 +9,12 @@ from loguru import logger
 from agents.adk_agents.bargainer.negotiation_brain import NegotiationBrain, NegotiationContext
 from agents.adk_agents.bargainer.voice_pipeline import VoicePipeline
 
+# Simulated pacing for the mock call flow. Module-level so tests (and
+# bulk simulations) can zero them out instead of paying real wall time
+# for cosmetic delays.
+CALL_SETUP_DELAY = 0.5
+THINKING_DELAY = 0.2
+
 async def _negotiate_one_vendor(vendor: Dict[str, Any], trip_context: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     (Private) Simulates a full negotiation voice call with a single vendor.
@@ -23,7 +29,7 @@ async def _negotiate_one_vendor(vendor: Dict[str, Any], trip_context: Dict[str,
 
     try:
         # Simulate network delay for realism
-        await asyncio.sleep(0.5)
+        await asyncio.sleep(CALL_SETUP_DELAY)
         
         voice_pipeline.speak(f"Namaste, kya meri baat {vendor.get('name')} se ho rahi hai?")
         vendor_response = voice_pipeline.listen()
@@ -38,7 +44,7 @@ async def _negotiate_one_vendor(vendor: Dict[str, Any], trip_context: Dict[str,
 
         for round_num in range(1, 6):
             # Simulate thinking/processing time
-            await asyncio.sleep(0.2)
+            await asyncio.sleep(THINKING_DELAY)
             
             context = NegotiationContext(
                 round_number=round_num,
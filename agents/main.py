@@ -5,7 +5,7 @@ from agents.shared import logger
 import asyncio
 import os
 import time
-import json
+from agents.shared import fastjson
 import httpx
 from dotenv import load_dotenv
 from agents.shared.audio_utils import generate_and_store_sarvam_audio
@@ -37,6 +37,11 @@ async def startup_event():
     logger.info("DesiYatra Agent System starting up...")
     logger.info(f"Running in Docker: {os.getenv('DOCKER_ENV', 'False')}")
 
+    # Pre-warm the Firestore gRPC channel so the first call doesn't pay
+    # credentials lookup + handshake latency.
+    from agents.shared.firestore_tools import warm_firestore
+    await asyncio.to_thread(warm_firestore)
+
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("DesiYatra Agent System shutting down...")
@@ -244,7 +249,7 @@ async def twilio_media_stream(websocket: WebSocket, call_id: str):
     
     try:
         async for message in websocket.iter_text():
-            data = json.loads(message)
+            data = fastjson.loads(message)
             event = data.get("event")
             
             if event == "start":
@@ -1,5 +1,7 @@
+import threading
+import time
 from supabase import create_client, Client
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from uuid import UUID
 from loguru import logger
 from .config import settings
@@ -23,10 +25,10 @@ def create_user(phone_number: str, name: str, preferred_language: str = "hinglis
             "trust_score": 1.0,
         }
         response = supabase.table("users").insert(data).execute()
-        logger.info(f"Created user: {phone_number}")
+        logger.info("Created user: {}", phone_number)
         return response.data[0] if response.data else None
     except Exception as e:
-        logger.error(f"Failed to create user: {str(e)}")
+        logger.error("Failed to create user: {}", e)
         return None
 
 
@@ -36,7 +38,7 @@ def get_user(user_id: str) -> Optional[Dict[str, Any]]:
         response = supabase.table("users").select("*").eq("id", user_id).execute()
         return response.data[0] if response.data else None
     except Exception as e:
-        logger.error(f"Failed to get user: {str(e)}")
+        logger.error("Failed to get user: {}", e)
         return None
 
 
@@ -46,7 +48,7 @@ def get_user_by_phone(phone_number: str) -> Optional[Dict[str, Any]]:
         response = supabase.table("users").select("*").eq("phone_number", phone_number).execute()
         return response.data[0] if response.data else None
     except Exception as e:
-        logger.error(f"Failed to get user by phone: {str(e)}")
+        logger.error("Failed to get user by phone: {}", e)
         return None
 
 
@@ -82,10 +84,10 @@ def create_trip(
             "status": "planning",
         }
         response = supabase.table("trips").insert(data).execute()
-        logger.info(f"Created trip: {destination} for user {user_id}")
+        logger.info("Created trip: {} for user {}", destination, user_id)
         return response.data[0] if response.data else None
     except Exception as e:
-        logger.error(f"Failed to create trip: {str(e)}")
+        logger.error("Failed to create trip: {}", e)
         return None
 
 
@@ -95,7 +97,7 @@ def get_trip(trip_id: str) -> Optional[Dict[str, Any]]:
         response = supabase.table("trips").select("*").eq("id", trip_id).execute()
         return response.data[0] if response.data else None
     except Exception as e:
-        logger.error(f"Failed to get trip: {str(e)}")
+        logger.error("Failed to get trip: {}", e)
         return None
 
 
@@ -107,10 +109,10 @@ def update_trip_status(trip_id: str, status: str, failure_reason: str = None) ->
             data["failure_reason"] = failure_reason
         
         response = supabase.table("trips").update(data).eq("id", trip_id).execute()
-        logger.info(f"Updated trip {trip_id} status to {status}")
+        logger.info("Updated trip {} status to {}", trip_id, status)
         return bool(response.data)
     except Exception as e:
-        logger.error(f"Failed to update trip status: {str(e)}")
+        logger.error("Failed to update trip status: {}", e)
         return False
 
 
@@ -120,7 +122,7 @@ def get_user_trips(user_id: str) -> List[Dict[str, Any]]:
         response = supabase.table("trips").select("*").eq("user_id", user_id).execute()
         return response.data or []
     except Exception as e:
-        logger.error(f"Failed to get user trips: {str(e)}")
+        logger.error("Failed to get user trips: {}", e)
         return []
 
 
@@ -148,20 +150,56 @@ def create_vendor(
             "metadata": metadata or {},
         }
         response = supabase.table("vendors").insert(data).execute()
-        logger.info(f"Created vendor: {name} ({phone_number})")
+        logger.info("Created vendor: {} ({})", name, phone_number)
         return response.data[0] if response.data else None
     except Exception as e:
-        logger.error(f"Failed to create vendor: {str(e)}")
+        logger.error("Failed to create vendor: {}", e)
         return None
 
 
+# Columns the negotiation path actually reads; skips the large `metadata`
+# JSON payload on every fetch.
+VENDOR_FIELDS = "id, phone_number, name, category, location, source, trust_score, is_blacklisted"
+
+
+# Several tools often ask for the same vendor within one agent turn.
+# Remember the last result per vendor for a short window so duplicates
+# don't each pay an HTTP round-trip. The helpers are synchronous, so this
+# is the sync analogue of in-flight request coalescing.
+_VENDOR_COALESCE_WINDOW = 0.05  # seconds
+_vendor_coalesce: Dict[str, Tuple[float, Optional[Dict[str, Any]]]] = {}
+_vendor_coalesce_lock = threading.Lock()
+
+
 def get_vendor(vendor_id: str) -> Optional[Dict[str, Any]]:
-    """Get vendor by ID."""
+    """Get vendor by ID (core fields only, see get_vendor_full)."""
+    now = time.monotonic()
+    with _vendor_coalesce_lock:
+        cached = _vendor_coalesce.get(vendor_id)
+        if cached and now - cached[0] < _VENDOR_COALESCE_WINDOW:
+            return cached[1]
+    try:
+        response = supabase.table("vendors").select(VENDOR_FIELDS).eq("id", vendor_id).execute()
+        vendor = response.data[0] if response.data else None
+        with _vendor_coalesce_lock:
+            _vendor_coalesce[vendor_id] = (time.monotonic(), vendor)
+            # Drop stale entries so the map stays bounded.
+            for stale_id in [k for k, (t, _) in _vendor_coalesce.items()
+                             if time.monotonic() - t >= _VENDOR_COALESCE_WINDOW]:
+                del _vendor_coalesce[stale_id]
+        return vendor
+    except Exception as e:
+        logger.error("Failed to get vendor: {}", e)
+        return None
+
+
+def get_vendor_full(vendor_id: str) -> Optional[Dict[str, Any]]:
+    """Get vendor by ID with all columns, including metadata."""
     try:
         response = supabase.table("vendors").select("*").eq("id", vendor_id).execute()
         return response.data[0] if response.data else None
     except Exception as e:
-        logger.error(f"Failed to get vendor: {str(e)}")
+        logger.error("Failed to get vendor: {}", e)
         return None
 
 
@@ -188,7 +226,7 @@ def get_vendors_by_category_location(
         
         return vendors[:limit]
     except Exception as e:
-        logger.error(f"Failed to get vendors: {str(e)}")
+        logger.error("Failed to get vendors: {}", e)
         return []
 
 
@@ -200,10 +238,10 @@ def blacklist_vendor(vendor_id: str, reason: str) -> bool:
             "blacklist_reason": reason,
         }
         response = supabase.table("vendors").update(data).eq("id", vendor_id).execute()
-        logger.warning(f"Blacklisted vendor {vendor_id}: {reason}")
+        logger.warning("Blacklisted vendor {}: {}", vendor_id, reason)
         return bool(response.data)
     except Exception as e:
-        logger.error(f"Failed to blacklist vendor: {str(e)}")
+        logger.error("Failed to blacklist vendor: {}", e)
         return False
 
 
@@ -214,7 +252,13 @@ def update_vendor_stats(
 ) -> bool:
     """Update vendor statistics after a call."""
     try:
-        vendor = get_vendor(vendor_id)
+        response = (
+            supabase.table("vendors")
+            .select("id, total_calls_made, successful_deals_count, average_discount_percentage")
+            .eq("id", vendor_id)
+            .execute()
+        )
+        vendor = response.data[0] if response.data else None
         if not vendor:
             return False
         
@@ -225,9 +269,8 @@ def update_vendor_stats(
         old_avg = vendor.get("average_discount_percentage", 0)
         new_avg = (old_avg * (total_calls - 1) + (discount_percentage if success else 0)) / total_calls
         
-        # Calculate new trust score
-        trust_score = 0.5 + (successful_deals / total_calls) if total_calls > 0 else 0.7
-        trust_score = min(0.95, trust_score)
+        # Calculate new trust score (total_calls >= 1 since we just incremented)
+        trust_score = min(0.95, 0.5 + successful_deals / total_calls)
         
         data = {
             "total_calls_made": total_calls,
@@ -237,10 +280,10 @@ def update_vendor_stats(
         }
         
         response = supabase.table("vendors").update(data).eq("id", vendor_id).execute()
-        logger.info(f"Updated vendor {vendor_id} stats: {total_calls} calls, {successful_deals} deals")
+        logger.info("Updated vendor {} stats: {} calls, {} deals", vendor_id, total_calls, successful_deals)
         return bool(response.data)
     except Exception as e:
-        logger.error(f"Failed to update vendor stats: {str(e)}")
+        logger.error("Failed to update vendor stats: {}", e)
         return False
 
 
@@ -262,20 +305,35 @@ def create_call(
             "status": "initiated",
         }
         response = supabase.table("calls").insert(data).execute()
-        logger.info(f"Created call record for trip {trip_id} and vendor {vendor_id}")
+        logger.info("Created call record for trip {} and vendor {}", trip_id, vendor_id)
         return response.data[0] if response.data else None
     except Exception as e:
-        logger.error(f"Failed to create call: {str(e)}")
+        logger.error("Failed to create call: {}", e)
         return None
 
 
 def get_call(call_id: str) -> Optional[Dict[str, Any]]:
-    """Get call by ID."""
+    """Get call by ID (status fields only, for polling paths)."""
+    try:
+        response = (
+            supabase.table("calls")
+            .select("id, trip_id, vendor_id, status, outcome, duration_seconds")
+            .eq("id", call_id)
+            .execute()
+        )
+        return response.data[0] if response.data else None
+    except Exception as e:
+        logger.error("Failed to get call: {}", e)
+        return None
+
+
+def get_call_full(call_id: str) -> Optional[Dict[str, Any]]:
+    """Get call by ID with all columns (recording, transcript, flags)."""
     try:
         response = supabase.table("calls").select("*").eq("id", call_id).execute()
         return response.data[0] if response.data else None
     except Exception as e:
-        logger.error(f"Failed to get call: {str(e)}")
+        logger.error("Failed to get call: {}", e)
         return None
 
 
@@ -308,10 +366,10 @@ def update_call_status(
             data["safety_flags"] = safety_flags
         
         response = supabase.table("calls").update(data).eq("id", call_id).execute()
-        logger.info(f"Updated call {call_id} status to {status}")
+        logger.info("Updated call {} status to {}", call_id, status)
         return bool(response.data)
     except Exception as e:
-        logger.error(f"Failed to update call: {str(e)}")
+        logger.error("Failed to update call: {}", e)
         return False
 
 
@@ -328,10 +386,10 @@ def add_call_event(
             "data": data,
         }
         response = supabase.table("call_events").insert(event_data).execute()
-        logger.debug(f"Added {event_type} event to call {call_id}")
+        logger.debug("Added {} event to call {}", event_type, call_id)
         return response.data[0] if response.data else None
     except Exception as e:
-        logger.error(f"Failed to add call event: {str(e)}")
+        logger.error("Failed to add call event: {}", e)
         return None
 
 
@@ -341,7 +399,7 @@ def get_call_events(call_id: str) -> List[Dict[str, Any]]:
         response = supabase.table("call_events").select("*").eq("call_id", call_id).execute()
         return response.data or []
     except Exception as e:
-        logger.error(f"Failed to get call events: {str(e)}")
+        logger.error("Failed to get call events: {}", e)
         return []
 
 
@@ -351,7 +409,7 @@ def get_trip_calls(trip_id: str) -> List[Dict[str, Any]]:
         response = supabase.table("calls").select("*").eq("trip_id", trip_id).execute()
         return response.data or []
     except Exception as e:
-        logger.error(f"Failed to get trip calls: {str(e)}")
+        logger.error("Failed to get trip calls: {}", e)
         return []
 
 
@@ -378,7 +436,7 @@ def get_market_rate(
         
         return None
     except Exception as e:
-        logger.error(f"Failed to get market rate: {str(e)}")
+        logger.error("Failed to get market rate: {}", e)
         return None
 
 
@@ -393,7 +451,7 @@ def get_market_rates_for_location(location: str) -> List[Dict[str, Any]]:
         
         return rates
     except Exception as e:
-        logger.error(f"Failed to get market rates: {str(e)}")
+        logger.error("Failed to get market rates: {}", e)
         return []
 
 
@@ -408,5 +466,5 @@ def health_check() -> bool:
         logger.success("✓ Supabase connection healthy")
         return True
     except Exception as e:
-        logger.error(f"✗ Supabase connection failed: {str(e)}")
+        logger.error("✗ Supabase connection failed: {}", e)
         return False
@@ -0,0 +1,28 @@
+"""
+JSON helpers for hot paths (Twilio media-stream frames arrive every 20ms).
+
+Uses orjson when installed (2-5x faster encode/decode than stdlib json)
+and falls back to the stdlib transparently. Both functions speak `str`
+at the boundary because the websocket layer sends/receives text frames.
+"""
+
+import json as _stdlib_json
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+if _orjson is not None:
+    def dumps(obj) -> str:
+        return _orjson.dumps(obj).decode()
+
+    def loads(data):
+        return _orjson.loads(data)
+else:
+    def dumps(obj) -> str:
+        return _stdlib_json.dumps(obj)
+
+    def loads(data):
+        return _stdlib_json.loads(data)
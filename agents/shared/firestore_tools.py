@@ -5,6 +5,10 @@ from google.cloud import firestore
 from google.api_core.exceptions import NotFound
 from loguru import logger
 
+# Strips phone-number formatting chars in one pass (no intermediate strings)
+# when deriving Firestore document IDs.
+_PHONE_SANITIZE = str.maketrans("", "", "+ -()")
+
 # Singleton Firestore Client
 _firestore_client = None
 
@@ -12,13 +16,34 @@ def _get_db():
     global _firestore_client
     if _firestore_client is None:
         try:
-            _firestore_client = firestore.Client()
+            # Pin project/database explicitly so the client skips the ADC
+            # project-discovery round-trip (metadata server on GCE).
+            _firestore_client = firestore.Client(
+                project=os.getenv("GCP_PROJECT") or os.getenv("GOOGLE_CLOUD_PROJECT"),
+                database=os.getenv("FIRESTORE_DB", "(default)"),
+            )
             logger.info("🔥 Firestore Client Initialized")
         except Exception as e:
             logger.error(f"❌ Failed to initialize Firestore: {e}")
             raise e
     return _firestore_client
 
+def warm_firestore() -> bool:
+    """
+    Builds the Firestore client and opens its gRPC channel ahead of traffic.
+
+    Call this once at application startup so the first real request doesn't
+    pay credentials lookup + channel setup (hundreds of ms).
+    """
+    try:
+        db = _get_db()
+        # Touching the transport forces the gRPC channel to open now.
+        _ = db._firestore_api
+        return True
+    except Exception as e:
+        logger.warning(f"⚠️ Firestore warm-up skipped: {e}")
+        return False
+
 # ============================================================================
 # AGENT TOOLS
 # ============================================================================
@@ -70,11 +95,14 @@ def get_negotiation_history(session_id: str, limit: int = 5) -> List[Dict[str, A
     """
     try:
         db = _get_db()
+        # Project to the fields the memory tools actually use so Firestore
+        # only sends those over the wire.
         query = (
             db.collection('agent_memories')
             .where('session_id', '==', session_id)
             .order_by('timestamp', direction=firestore.Query.DESCENDING)
             .limit(limit)
+            .select(['type', 'content', 'timestamp'])
         )
         
         results = []
@@ -90,6 +118,37 @@ def get_negotiation_history(session_id: str, limit: int = 5) -> List[Dict[str, A
         logger.error(f"Failed to get history: {e}")
         return []
 
+def save_negotiation_memories_batch(
+    session_id: str,
+    memories: List[Dict[str, Any]]
+) -> str:
+    """
+    Saves several memories in a single batched write.
+
+    Args:
+        session_id: The unique ID of the call/session.
+        memories: A list of {"type": ..., "content": ...} dicts.
+
+    Returns:
+        A status message with the number of memories written.
+    """
+    try:
+        db = _get_db()
+        batch = db.batch()
+        for memory in memories:
+            doc_ref = db.collection('agent_memories').document()
+            batch.set(doc_ref, {
+                "session_id": session_id,
+                "type": memory.get("type"),
+                "content": memory.get("content"),
+                "timestamp": firestore.SERVER_TIMESTAMP
+            })
+        batch.commit()
+        return f"✅ Saved {len(memories)} memories in one batch"
+    except Exception as e:
+        logger.error(f"Failed to batch-save memories: {e}")
+        return f"❌ Error saving memories: {str(e)}"
+
 def update_vendor_profile(
     phone_number: str,
     updates: Dict[str, Any]
@@ -108,7 +167,7 @@ def update_vendor_profile(
     try:
         db = _get_db()
         # Sanitize phone number for use as doc ID
-        doc_id = phone_number.replace("+", "").replace(" ", "")
+        doc_id = phone_number.translate(_PHONE_SANITIZE)
         doc_ref = db.collection('vendor_profiles').document(doc_id)
         
         doc_ref.set(updates, merge=True)
@@ -129,7 +188,7 @@ def get_vendor_profile(phone_number: str) -> Dict[str, Any]:
     """
     try:
         db = _get_db()
-        doc_id = phone_number.replace("+", "").replace(" ", "")
+        doc_id = phone_number.translate(_PHONE_SANITIZE)
         doc_ref = db.collection('vendor_profiles').document(doc_id)
         
         doc = doc_ref.get()
@@ -140,3 +199,32 @@ def get_vendor_profile(phone_number: str) -> Dict[str, Any]:
     except Exception as e:
         logger.error(f"Failed to get vendor profile: {e}")
         return {}
+
+def get_vendor_profiles(phone_numbers: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Retrieves several vendor profiles in a single batched read.
+
+    Uses Firestore's `get_all` so N profiles cost one gRPC round-trip
+    instead of N (e.g. when comparing 10 candidate vendors).
+
+    Args:
+        phone_numbers: The vendors' phone numbers.
+
+    Returns:
+        A dict mapping each phone number to its profile (empty dict if new).
+    """
+    try:
+        db = _get_db()
+        doc_ids = {
+            phone_number.translate(_PHONE_SANITIZE): phone_number
+            for phone_number in phone_numbers
+        }
+        refs = [db.collection('vendor_profiles').document(doc_id) for doc_id in doc_ids]
+        profiles = {phone_number: {} for phone_number in phone_numbers}
+        for doc in db.get_all(refs):
+            if doc.exists:
+                profiles[doc_ids[doc.id]] = doc.to_dict()
+        return profiles
+    except Exception as e:
+        logger.error(f"Failed to get vendor profiles: {e}")
+        return {}
@@ -3,6 +3,7 @@ Database initialization script - applies migrations to Supabase
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from loguru import logger
 from agents.shared.config import settings
@@ -18,14 +19,13 @@ def get_migration_files() -> list[tuple[str, str]]:
         return []
     
     migration_files = sorted(migrations_dir.glob("*.sql"))
-    migrations = []
-    
-    for file in migration_files:
-        with open(file, 'r') as f:
-            content = f.read()
-            migrations.append((file.name, content))
-    
-    return migrations
+
+    # Read the files concurrently so cold filesystem layers (NFS, container
+    # overlays) don't serialize the reads.
+    with ThreadPoolExecutor() as executor:
+        contents = list(executor.map(Path.read_text, migration_files))
+
+    return [(file.name, content) for file, content in zip(migration_files, contents)]
 
 
 def apply_migrations() -> bool:
@@ -43,15 +43,13 @@ def apply_migrations() -> bool:
     for migration_name, migration_sql in migrations:
         try:
             logger.info(f"Applying migration: {migration_name}")
-            
-            # Split by semicolon to handle multiple statements
-            statements = [stmt.strip() for stmt in migration_sql.split(';') if stmt.strip()]
-            
-            for statement in statements:
-                # Execute using Supabase client
-                response = supabase.rpc("execute_sql", {"sql": statement})
-                logger.debug(f"Executed: {statement[:100]}...")
-            
+
+            # Postgres executes multi-statement SQL in a single message, so
+            # send the whole file in one RPC instead of splitting on ';' and
+            # paying one HTTP round-trip per statement.
+            response = supabase.rpc("execute_sql", {"sql": migration_sql}).execute()
+            logger.debug(f"Executed: {migration_sql[:100]}...")
+
             logger.success(f"✓ Migration applied: {migration_name}")
             
         except Exception as e:
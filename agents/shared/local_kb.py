@@ -0,0 +1,115 @@
+"""
+Local, in-process knowledge-base index.
+
+DesiYatra's tactic KB is tiny by ANN standards (tens to a few thousand
+entries), so a deployed MatchingEngine index mostly charges us a network
+round-trip per lookup. At this scale an exact inner-product scan over a
+float32 matrix answers in well under a millisecond in-process, with no
+RPC and no recall loss.
+
+The index file is a .npz with two arrays:
+  - embeddings: (N, dim) float32 matrix
+  - payloads:   (N,) array of JSON-encoded tactic dicts (id/text/category)
+
+Set LOCAL_KB_INDEX_PATH to enable; `search_knowledge_base` prefers this
+index over the remote Vector Search endpoint when it loads.
+"""
+
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from loguru import logger
+
+
+def _tokenize(text: str) -> frozenset:
+    """Lowercased token set used for the keyword half of hybrid scoring."""
+    return frozenset(text.lower().split())
+
+
+class LocalTacticIndex:
+    """Exact inner-product index over the tactic embeddings."""
+
+    def __init__(self, embeddings: np.ndarray, payloads: List[Dict[str, Any]]):
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True) + 1e-12
+        self._matrix = matrix / norms
+        self._payloads = payloads
+        # Tokenized once here so hybrid lookups never re-lower payload text
+        self._token_sets = [_tokenize(p.get("text", "")) for p in payloads]
+
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+    def search(self, query_embedding, limit: int = 3) -> List[Dict[str, Any]]:
+        """Returns the top `limit` tactics by cosine similarity."""
+        q = np.asarray(query_embedding, dtype=np.float32)
+        q /= np.linalg.norm(q) + 1e-12
+        scores = self._matrix @ q
+        top = np.argsort(scores)[::-1][:limit]
+        return [
+            {**self._payloads[i], "score": float(scores[i])}
+            for i in top
+        ]
+
+    def search_hybrid(self, query: str, query_embedding, limit: int = 3,
+                      keyword_weight: float = 0.4) -> List[Dict[str, Any]]:
+        """Ranks tactics by a weighted keyword + cosine score.
+
+        Pure vector search misses exact-term matches (vendor names, Hindi
+        phrases like "market rate") and pure keyword search misses
+        paraphrases; a 0.4/0.6 blend computed in one in-process pass
+        covers both without a second round-trip to merge result lists.
+        """
+        q = np.asarray(query_embedding, dtype=np.float32)
+        q /= np.linalg.norm(q) + 1e-12
+        cosine = self._matrix @ q
+
+        qtoks = _tokenize(query)
+        if qtoks:
+            keyword = np.fromiter(
+                (len(qtoks & tokens) / len(qtoks) for tokens in self._token_sets),
+                dtype=np.float32,
+                count=len(self._token_sets),
+            )
+        else:
+            keyword = np.zeros(len(self._token_sets), dtype=np.float32)
+
+        scores = keyword_weight * keyword + (1.0 - keyword_weight) * cosine
+        top = np.argsort(scores)[::-1][:limit]
+        return [
+            {**self._payloads[i], "score": float(scores[i])}
+            for i in top
+        ]
+
+    def save(self, path: str):
+        np.savez(
+            path,
+            embeddings=self._matrix,
+            payloads=np.array([json.dumps(p) for p in self._payloads]),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> Optional["LocalTacticIndex"]:
+        try:
+            data = np.load(path, allow_pickle=False)
+            payloads = [json.loads(p) for p in data["payloads"]]
+            return cls(data["embeddings"], payloads)
+        except Exception as e:
+            logger.warning(f"Failed to load local KB index from {path}: {e}")
+            return None
+
+
+@lru_cache(maxsize=1)
+def get_local_index() -> Optional[LocalTacticIndex]:
+    """Loads the local index once per process, if configured and present."""
+    path = os.getenv("LOCAL_KB_INDEX_PATH")
+    if not path or not Path(path).exists():
+        return None
+    index = LocalTacticIndex.load(path)
+    if index is not None:
+        logger.info(f"📚 Local KB index loaded ({len(index)} tactics)")
+    return index
@@ -3,9 +3,12 @@ import sys
 from .config import settings
 
 logger.remove()
+# enqueue=True moves formatting and writes to a background thread so log
+# calls on hot data-access paths don't block on stdout/file I/O.
 logger.add(
     sys.stdout,
     level=settings.log_level,
+    enqueue=True,
     format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>"
 )
 
@@ -14,5 +17,6 @@ logger.add(
     rotation="00:00",
     retention="30 days",
     level=settings.log_level,
+    enqueue=True,
     format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function} - {message}"
 )
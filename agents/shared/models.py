@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
@@ -45,6 +45,8 @@ class SafetyRecommendation(str, Enum):
 
 
 class Trip(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: Optional[str] = None
     user_id: str
     destination: str
@@ -55,12 +57,14 @@ class Trip(BaseModel):
     budget_max: float
     budget_stretch: float
     services: List[str]
-    preferences: Dict[str, Any] = {}
+    preferences: Dict[str, Any] = Field(default_factory=dict)
     status: TripStatus = TripStatus.PLANNING
     created_at: Optional[datetime] = None
 
 
 class Vendor(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: Optional[str] = None
     phone: str
     name: str
@@ -68,10 +72,12 @@ class Vendor(BaseModel):
     location: str
     source: str
     trust_score: float = 0.7
-    metadata: Dict[str, Any] = {}
+    metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
 class Call(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: Optional[str] = None
     trip_id: str
     vendor_id: str
@@ -82,15 +88,17 @@ class Call(BaseModel):
     final_offer: Optional[float] = None
     outcome: Optional[CallOutcome] = None
     recording_url: Optional[str] = None
-    transcript: List[Dict[str, Any]] = []
-    safety_flags: List[str] = []
-    negotiation_summary: Dict[str, Any] = {}
+    transcript: List[Dict[str, Any]] = Field(default_factory=list)
+    safety_flags: List[str] = Field(default_factory=list)
+    negotiation_summary: Dict[str, Any] = Field(default_factory=dict)
 
 
 class AgentUpdate(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     trip_id: str
     agent: str
     state: str
     message: str
-    data: Dict[str, Any] = {}
-    timestamp: datetime = datetime.now()
+    data: Dict[str, Any] = Field(default_factory=dict)
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
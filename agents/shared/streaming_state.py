@@ -8,9 +8,12 @@ async def push_to_queue(call_id: str, text: str):
     """Pushes text to the Redis queue for the given call_id."""
     key = f"call_queue:{call_id}"
     try:
-        await redis_client.rpush(key, text)
-        # Set expiry to auto-cleanup old queues (e.g., 1 hour)
-        await redis_client.expire(key, 3600)
+        # Pipeline the push + expiry (auto-cleanup after 1 hour) so the
+        # hot call path pays one round-trip instead of two.
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.rpush(key, text)
+            pipe.expire(key, 3600)
+            await pipe.execute()
     except Exception as e:
         logger.error(f"Redis push failed: {e}")
 
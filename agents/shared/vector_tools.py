@@ -1,21 +1,41 @@
 
 import os
-from typing import List, Dict, Any, Optional
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+import numpy as np
 from loguru import logger
-import vertexai
-from vertexai.language_models import TextEmbeddingModel
-from google.cloud import aiplatform
 
-# Initialize Vertex AI
 PROJECT_ID = os.getenv("GOOGLE_CLOUD_PROJECT")
 LOCATION = os.getenv("GOOGLE_CLOUD_LOCATION", "asia-south1")
 
-if PROJECT_ID:
-    try:
-        vertexai.init(project=PROJECT_ID, location=LOCATION)
-        aiplatform.init(project=PROJECT_ID, location=LOCATION)
-    except Exception as e:
-        logger.warning(f"Failed to initialize Vertex AI: {e}")
+# The vertexai/aiplatform imports cost ~0.5-1.5s and many callers (tests,
+# agents that never touch the KB) import this module transitively. They are
+# deferred into the functions that actually need them, and SDK init happens
+# once on first use instead of at import time.
+_initialized = False
+_init_lock = threading.Lock()
+
+def _ensure_initialized():
+    global _initialized
+    with _init_lock:
+        if _initialized:
+            return
+        if PROJECT_ID:
+            try:
+                import vertexai
+                from google.cloud import aiplatform
+                vertexai.init(project=PROJECT_ID, location=LOCATION)
+                # gRPC multiplexes concurrent requests over one thread-safe
+                # channel, so batched/threaded callers share a connection
+                # instead of serializing on per-call transport setup.
+                aiplatform.init(project=PROJECT_ID, location=LOCATION, api_transport="grpc")
+            except Exception as e:
+                logger.warning(f"Failed to initialize Vertex AI: {e}")
+        _initialized = True
 
 # Global models
 _embedding_model = None
@@ -24,20 +44,226 @@ def _get_embedding_model():
     global _embedding_model
     if _embedding_model is None:
         try:
+            _ensure_initialized()
+            from vertexai.language_models import TextEmbeddingModel
             _embedding_model = TextEmbeddingModel.from_pretrained("text-embedding-004")
         except Exception as e:
             logger.error(f"Failed to load embedding model: {e}")
             raise e
     return _embedding_model
 
-def get_embedding(text: str) -> List[float]:
-    """Generates vector embedding for the given text."""
+@lru_cache(maxsize=None)
+def _get_index_endpoint(index_endpoint_id: str):
+    """
+    Per-process MatchingEngineIndexEndpoint, pinned to the configured region.
+
+    Constructing the endpoint per query rebuilt the transport each time;
+    the cached instance keeps its channel alive across calls so repeat
+    queries skip connection setup.
+    """
+    _ensure_initialized()
+    from google.cloud import aiplatform
+    return aiplatform.MatchingEngineIndexEndpoint(
+        index_endpoint_name=index_endpoint_id,
+        project=PROJECT_ID,
+        location=LOCATION,
+    )
+
+@lru_cache(maxsize=4096)
+def _embed_cached(text_norm: str) -> List[float]:
+    """Embeds normalized text via Vertex AI; repeat queries hit the cache.
+
+    Checks the persistent on-disk cache before calling Vertex, so hot
+    queries survive process restarts. Raises on API failure so errors
+    are never cached.
+    """
+    from agents.shared import embedding_cache
+    cached = embedding_cache.get(text_norm)
+    if cached is not None:
+        return cached
+    model = _get_embedding_model()
+    embeddings = model.get_embeddings([text_norm])
+    vector = embeddings[0].values
+    embedding_cache.put(text_norm, vector)
+    return vector
+
+def get_embedding(text: str) -> np.ndarray:
+    """Generates the vector embedding for the given text.
+
+    Returns a unit-normalized contiguous float32 array (shape (768,)), so
+    downstream cosine comparisons (semantic cache, local index) are plain
+    dot products and no caller re-normalizes. Empty array on failure.
+    """
     try:
-        model = _get_embedding_model()
-        embeddings = model.get_embeddings([text])
-        return embeddings[0].values
+        # Normalize so trivially different phrasings share a cache slot.
+        vector = np.asarray(_embed_cached(text.strip().lower()), dtype=np.float32)
+        vector /= np.linalg.norm(vector) + 1e-12
+        return vector
     except Exception as e:
         logger.error(f"Failed to get embedding: {e}")
+        return np.empty(0, dtype=np.float32)
+
+# --- Dynamic batching for concurrent embedding callers --------------------
+# Several agents searching the KB at once would each fire a single-item
+# embedding request. A background worker collects queries arriving within a
+# short window and issues one multi-text request for the whole batch.
+
+_BATCH_MAX_SIZE = 64
+_BATCH_MAX_WAIT = 0.01  # seconds
+
+_batch_queue: "queue.Queue[Tuple[str, Future]]" = queue.Queue()
+_batch_worker_started = False
+_batch_worker_lock = threading.Lock()
+
+def _batch_worker():
+    while True:
+        text, future = _batch_queue.get()
+        batch = [(text, future)]
+        deadline = time.monotonic() + _BATCH_MAX_WAIT
+        while len(batch) < _BATCH_MAX_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_batch_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        try:
+            from agents.shared import embedding_cache
+            vectors = get_embeddings_batch([t for t, _ in batch])
+            if len(vectors) != len(batch):
+                raise RuntimeError("Embedding batch returned wrong count")
+            for (batch_text, fut), vector in zip(batch, vectors):
+                # Same contract as get_embedding: persist the raw vector,
+                # resolve with a unit-normalized float32 array so callers
+                # can feed it straight into dot-product comparisons.
+                embedding_cache.put(batch_text, list(vector))
+                unit = np.asarray(vector, dtype=np.float32)
+                unit /= np.linalg.norm(unit) + 1e-12
+                fut.set_result(unit)
+        except Exception as e:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+
+def get_embedding_async(text: str) -> Future:
+    """
+    Queues `text` for batched embedding and returns a Future.
+
+    Concurrent callers arriving within ~10ms share one Vertex request
+    (up to 64 texts). `future.result()` yields the same unit-normalized
+    float32 ndarray that get_embedding returns.
+    """
+    global _batch_worker_started
+    with _batch_worker_lock:
+        if not _batch_worker_started:
+            threading.Thread(target=_batch_worker, daemon=True, name="embedding-batcher").start()
+            _batch_worker_started = True
+    future: Future = Future()
+    # Same text normalization as get_embedding, so both paths share
+    # cache keys.
+    _batch_queue.put((text.strip().lower(), future))
+    return future
+
+def _cache_lookup(matrix: np.ndarray, q: np.ndarray, tau: float) -> int:
+    """Returns the row of `matrix` most similar to `q`, or -1 below `tau`.
+
+    Rows and `q` are unit-normalized float32, so similarity is one gemv.
+    """
+    similarities = matrix @ q
+    best = int(np.argmax(similarities))
+    return best if similarities[best] >= tau else -1
+
+try:
+    # Optional: numba fuses the gemv + argmax + threshold into one JIT'd
+    # kernel (single-digit µs at N=1024). The numpy version above is the
+    # fallback when numba isn't installed.
+    from numba import njit
+    _cache_lookup = njit(cache=True, fastmath=True)(_cache_lookup)
+except ImportError:
+    pass
+
+class SemanticQueryCache:
+    """
+    Approximate cache for KB search results.
+
+    Near-duplicate queries ("handle stubborn driver" vs "stubborn taxi
+    driver") embed close together, so instead of exact-match caching we
+    compare the query embedding against recent ones by cosine similarity
+    and reuse the cached neighbor list above a threshold. One gemv over
+    ~1MB replaces an embedding + ANN round-trip.
+    """
+
+    def __init__(self, capacity: int = 1024, threshold: float = 0.92, ttl_seconds: float = 300.0):
+        self.capacity = capacity
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self._matrix: Optional[np.ndarray] = None  # (N, dim) unit rows, float32
+        self._entries: List[Tuple[float, List[Dict[str, Any]]]] = []  # (timestamp, results)
+
+    @staticmethod
+    def _unit(embedding) -> np.ndarray:
+        v = np.asarray(embedding, dtype=np.float32)
+        return v / (np.linalg.norm(v) + 1e-12)
+
+    def get(self, embedding, limit: int = 0) -> Optional[List[Dict[str, Any]]]:
+        """Returns cached results for a semantically close query, or None.
+
+        Entries hold however many neighbors the populating call asked
+        for, so a hit that is shorter than `limit` counts as a miss —
+        otherwise a later, wider search would silently get the
+        truncated list.
+        """
+        if self._matrix is None or not len(self._entries):
+            return None
+        best = _cache_lookup(self._matrix, self._unit(embedding), self.threshold)
+        if best < 0:
+            return None
+        timestamp, results = self._entries[best]
+        if time.monotonic() - timestamp > self.ttl_seconds:
+            return None
+        if len(results) < limit:
+            return None
+        return results
+
+    def put(self, embedding, results: List[Dict[str, Any]]):
+        row = self._unit(embedding)[np.newaxis, :]
+        if self._matrix is None:
+            self._matrix = row
+        else:
+            self._matrix = np.vstack([self._matrix, row])
+        self._entries.append((time.monotonic(), results))
+        if len(self._entries) > self.capacity:
+            # FIFO eviction
+            self._matrix = self._matrix[1:]
+            self._entries.pop(0)
+
+_query_cache = SemanticQueryCache()
+
+# Bounded pool for ANN queries: every caller reuses the cached endpoint's
+# gRPC channel, and the worker cap keeps queue depth (and tail latency)
+# under control when many agents search at once.
+_search_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="kb-search")
+
+# Vertex caps get_embeddings at 250 texts per request
+_EMBED_BATCH_LIMIT = 250
+
+def get_embeddings_batch(texts: List[str]) -> List[List[float]]:
+    """
+    Generates embeddings for many texts in as few API calls as possible.
+
+    Sends up to 250 texts (the Vertex per-request limit) per round-trip
+    instead of one call per text.
+    """
+    try:
+        model = _get_embedding_model()
+        vectors = []
+        for start in range(0, len(texts), _EMBED_BATCH_LIMIT):
+            chunk = texts[start:start + _EMBED_BATCH_LIMIT]
+            vectors.extend(e.values for e in model.get_embeddings(chunk))
+        return vectors
+    except Exception as e:
+        logger.error(f"Failed to get batch embeddings: {e}")
         return []
 
 def search_knowledge_base(query: str, limit: int = 3) -> List[Dict[str, Any]]:
@@ -51,9 +277,20 @@ def search_knowledge_base(query: str, limit: int = 3) -> List[Dict[str, Any]]:
     Returns:
         List of matched documents with metadata.
     """
+    # A local index answers in-process (no RPC) and is exact at KB scale;
+    # prefer it whenever one is configured.
+    from agents.shared import local_kb
+    local_index = local_kb.get_local_index()
+    if local_index is not None:
+        local_embedding = get_embedding(query)
+        if local_embedding.size:
+            # Hybrid keyword+cosine ranking: exact terms and paraphrases
+            # both land, scored in one in-process pass.
+            return local_index.search_hybrid(query, local_embedding, limit)
+
     index_endpoint_id = os.getenv("VECTOR_INDEX_ENDPOINT_ID")
     deployed_index_id = os.getenv("VECTOR_DEPLOYED_INDEX_ID")
-    
+
     if not index_endpoint_id or not deployed_index_id:
         logger.warning("⚠️ Vector Search not configured. Using mock results.")
         logger.warning("   Set VECTOR_INDEX_ENDPOINT_ID and VECTOR_DEPLOYED_INDEX_ID to use real search")
@@ -62,51 +299,59 @@ def search_knowledge_base(query: str, limit: int = 3) -> List[Dict[str, Any]]:
     try:
         # Get query embedding
         query_embedding = get_embedding(query)
-        if not query_embedding:
+        if not query_embedding.size:
             logger.error("Failed to generate query embedding")
             return _mock_search(query)
-        
-        # Connect to index endpoint
-        endpoint = aiplatform.MatchingEngineIndexEndpoint(
-            index_endpoint_name=index_endpoint_id
-        )
-        
+
+        # Semantically close query seen recently? Skip the ANN round-trip.
+        cached = _query_cache.get(query_embedding, limit)
+        if cached is not None:
+            logger.info(f"⚡ Semantic cache hit for: '{query[:50]}'")
+            return cached[:limit]
+
+        # Connect to index endpoint (cached per process)
+        endpoint = _get_index_endpoint(index_endpoint_id)
+
         # Perform vector search
         logger.info(f"🔍 Searching Vector Index for: '{query[:50]}...'")
         
-        response = endpoint.find_neighbors(
+        response = _search_executor.submit(
+            endpoint.find_neighbors,
             deployed_index_id=deployed_index_id,
-            queries=[query_embedding],
+            queries=[query_embedding.tolist()],
             num_neighbors=limit,
-        )
+        ).result()
         
         # Parse results
         results = []
         if response and len(response) > 0:
             neighbors = response[0]
-            
-            for neighbor in neighbors:
-                # Extract metadata
-                metadata = neighbor.id  # The ID we stored
-                distance = neighbor.distance
-                
-                # Reconstruct result object
-                result = {
-                    "id": metadata,
-                    "distance": distance,
-                    "score": 1 / (1 + distance),  # Convert distance to similarity score
-                }
-                
-                # In production, metadata would contain the full tactic text
-                # For now, we'll need to fetch it from Firestore or store it during indexing
-                
-                results.append(result)
-            
+
+            # Score all neighbors in one vectorized pass. The index is
+            # configured with DOT_PRODUCT_DISTANCE, which reports the
+            # negated inner product — similarity is simply -distance
+            # (the old 1/(1+d) mapping inverted the ranking for it).
+            ids = [neighbor.id for neighbor in neighbors]
+            distances = np.fromiter(
+                (neighbor.distance for neighbor in neighbors),
+                dtype=np.float32,
+                count=len(neighbors),
+            )
+            scores = -distances
+
+            # In production, the id would key the full tactic text
+            # (fetched from Firestore or stored alongside the index).
+            results = [
+                {"id": doc_id, "distance": float(distance), "score": float(score)}
+                for doc_id, distance, score in zip(ids, distances, scores)
+            ]
+
             logger.info(f"✅ Found {len(results)} relevant tactics")
+            _query_cache.put(query_embedding, results)
         else:
             logger.warning("No results found, using fallback")
             return _mock_search(query)
-        
+
         return results
         
     except Exception as e:
@@ -114,40 +359,117 @@ def search_knowledge_base(query: str, limit: int = 3) -> List[Dict[str, Any]]:
         logger.warning("Falling back to mock search")
         return _mock_search(query)
 
+# Fallback tactics served while Vector Search isn't provisioned
+_MOCK_TACTICS = [
+    {
+        "id": "tactic_001",
+        "text": "If vendor is stubborn, mention 'market rate' and offer to book immediately.",
+        "category": "stubborn_vendor"
+    },
+    {
+        "id": "tactic_002",
+        "text": "For long trips, emphasize 'return fare' is included or not applicable.",
+        "category": "long_distance"
+    },
+    {
+        "id": "tactic_003",
+        "text": "Use 'DesiYatra corporate partner' status to build trust.",
+        "category": "trust_building"
+    }
+]
+
+_TOKEN_STRIP = ".,!?'\"()"
+
+def _tokenize(text: str) -> frozenset:
+    """Lowercased, punctuation-stripped token set for a text.
+
+    Unicode case-folding (Devanagari included) is per-character table
+    work, so tactic texts are tokenized exactly once at import and only
+    the query pays this cost at lookup time.
+    """
+    return frozenset(word.strip(_TOKEN_STRIP) for word in text.lower().split())
+
+# Per-tactic token sets, precomputed once at import (kept out of the
+# tactic dicts so callers never see a private field).
+_TACTIC_TOKENS = tuple(_tokenize(tactic["text"]) for tactic in _MOCK_TACTICS)
+
+def _build_token_index() -> Dict[str, frozenset]:
+    """Maps each word to the set of tactic indices containing it."""
+    index: Dict[str, set] = {}
+    for i, tokens in enumerate(_TACTIC_TOKENS):
+        for word in tokens:
+            index.setdefault(word, set()).add(i)
+    return {word: frozenset(ids) for word, ids in index.items()}
+
+# Precomputed once at import so each query is O(|query terms|) set lookups
+# instead of a scan over every tactic text.
+_token_index = _build_token_index()
+
 def _mock_search(query: str) -> List[Dict[str, Any]]:
     """Temporary mock search until Vector Search is fully provisioned."""
     logger.info(f"🔍 Mock searching for: {query}")
-    
-    # Simple keyword matching for demo
-    tactics = [
-        {
-            "id": "tactic_001",
-            "text": "If vendor is stubborn, mention 'market rate' and offer to book immediately.",
-            "category": "stubborn_vendor"
-        },
-        {
-            "id": "tactic_002",
-            "text": "For long trips, emphasize 'return fare' is included or not applicable.",
-            "category": "long_distance"
-        },
-        {
-            "id": "tactic_003",
-            "text": "Use 'DesiYatra corporate partner' status to build trust.",
-            "category": "trust_building"
-        }
-    ]
-    
-    return [t for t in tactics if any(word in t['text'].lower() for word in query.lower().split())] or tactics[:1]
 
-def add_tactic_to_kb(text: str, category: str) -> str:
+    qtoks = _tokenize(query)
+    hits = set().union(*(_token_index.get(word, frozenset()) for word in qtoks)) if qtoks else set()
+
+    # Best-overlap first so multi-term queries rank the closest tactic on top
+    ranked = sorted(hits, key=lambda i: (-len(qtoks & _TACTIC_TOKENS[i]), i))
+    return [_MOCK_TACTICS[i] for i in ranked] or _MOCK_TACTICS[:1]
+
+# --- Fire-and-forget tactic ingestion --------------------------------------
+# Curation flows don't need the embedding on the response path, so by default
+# the Vertex call happens on a background worker and the caller returns in
+# milliseconds instead of blocking 500-2000ms.
+
+_tactic_jobs: Dict[str, str] = {}  # job_id -> 'queued' | 'done' | 'failed'
+_tactic_queue: "queue.Queue[Tuple[str, str, str]]" = queue.Queue()
+_tactic_worker_started = False
+_tactic_worker_lock = threading.Lock()
+
+def _tactic_worker():
+    while True:
+        job_id, text, category = _tactic_queue.get()
+        try:
+            embedding = get_embedding(text)
+            if not embedding.size:
+                raise RuntimeError("empty embedding")
+            # TODO: Upload to Vector Search Index
+            logger.info(f"Generated embedding for: {text[:30]}...")
+            _tactic_jobs[job_id] = "done"
+        except Exception as e:
+            logger.error(f"Failed to embed tactic {job_id}: {e}")
+            _tactic_jobs[job_id] = "failed"
+
+def get_tactic_job_status(job_id: str) -> str:
+    """Returns 'queued', 'done', 'failed', or 'unknown' for an async add."""
+    return _tactic_jobs.get(job_id, "unknown")
+
+def add_tactic_to_kb(text: str, category: str, generate_embedding: str = "async") -> str:
     """
     Adds a new tactic to the knowledge base.
     In production, this would upload the embedding to the Vector Index.
+
+    With generate_embedding='async' (the default) the embedding is computed
+    on a background worker and the call returns immediately with a job id;
+    pass 'sync' to block until the embedding exists.
     """
-    embedding = get_embedding(text)
-    if not embedding:
-        return "❌ Failed to generate embedding"
-        
-    # TODO: Upload to Vector Search Index
-    logger.info(f"Generated embedding for: {text[:30]}...")
-    return "✅ Tactic added to indexing queue (simulated)"
+    if generate_embedding == "sync":
+        embedding = get_embedding(text)
+        if not embedding.size:
+            return "❌ Failed to generate embedding"
+
+        # TODO: Upload to Vector Search Index
+        logger.info(f"Generated embedding for: {text[:30]}...")
+        return "✅ Tactic added to indexing queue (simulated)"
+
+    global _tactic_worker_started
+    with _tactic_worker_lock:
+        if not _tactic_worker_started:
+            threading.Thread(target=_tactic_worker, daemon=True, name="tactic-embedder").start()
+            _tactic_worker_started = True
+
+    import uuid
+    job_id = uuid.uuid4().hex[:12]
+    _tactic_jobs[job_id] = "queued"
+    _tactic_queue.put((job_id, text, category))
+    return f"✅ Tactic added to indexing queue (job: {job_id})"
@@ -0,0 +1,16 @@
+-- Function to check several tables for existence in one round-trip
+CREATE OR REPLACE FUNCTION check_tables(names TEXT[])
+RETURNS TABLE(name TEXT, exists BOOLEAN) AS $$
+BEGIN
+    RETURN QUERY
+    SELECT
+        n AS name,
+        EXISTS (
+            SELECT 1
+            FROM information_schema.tables t
+            WHERE t.table_schema = 'public'
+                AND t.table_name = n
+        ) AS exists
+    FROM unnest(names) AS n;
+END;
+$$ LANGUAGE plpgsql STABLE;
@@ -7,6 +7,7 @@ import subprocess
 import sys
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 def run_command(cmd, check=True):
@@ -62,10 +63,16 @@ def main():
         "generativelanguage.googleapis.com"
     ]
     
-    for api in apis:
-        print(f"   Enabling {api}...")
-        run_command(f"gcloud services enable {api} --project={project_id}")
-    
+    # Each enable takes 5-30s and they are independent — run them concurrently
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {
+            executor.submit(run_command, f"gcloud services enable {api} --project={project_id}"): api
+            for api in apis
+        }
+        for future in as_completed(futures):
+            future.result()
+            print(f"   ✓ Enabled {futures[future]}")
+
     print("✅ APIs enabled")
     print()
     
@@ -104,9 +111,20 @@ def main():
         "roles/bigquery.dataViewer"
     ]
     
-    for role in roles:
-        run_command(f'gcloud projects add-iam-policy-binding {project_id} --member="serviceAccount:{sa_email}" --role="{role}" --condition=None', check=False)
-    
+    # Role bindings are independent and idempotent — fan them out too
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {
+            executor.submit(
+                run_command,
+                f'gcloud projects add-iam-policy-binding {project_id} --member="serviceAccount:{sa_email}" --role="{role}" --condition=None',
+                check=False,
+            ): role
+            for role in roles
+        }
+        for future in as_completed(futures):
+            future.result()
+            print(f"   ✓ Bound {futures[future]}")
+
     print("✅ Permissions granted")
     print()
     
@@ -138,30 +156,29 @@ def main():
     print("📝 Updating .env file...")
     env_path = Path(".env")
     
+    blocked = ['GOOGLE_CLOUD_PROJECT', 'GOOGLE_APPLICATION_CREDENTIALS', 'GOOGLE_API_KEY']
+
     if env_path.exists():
-        # Backup
-        import shutil
-        shutil.copy(env_path, ".env.backup")
+        existing = env_path.read_text()
+        # Atomic backup: a single rename, no read+write copy
+        env_path.replace(env_path.with_suffix('.backup'))
         print("✅ Backed up existing .env to .env.backup")
-        
-        # Read existing
-        with open(env_path, 'r') as f:
-            lines = f.readlines()
-        
-        # Remove old GCP config
-        lines = [l for l in lines if not any(k in l for k in ['GOOGLE_CLOUD_PROJECT', 'GOOGLE_APPLICATION_CREDENTIALS', 'GOOGLE_API_KEY'])]
+
+        # Drop old GCP config lines
+        keep = (l for l in existing.splitlines(keepends=True) if not any(k in l for k in blocked))
+        body = "".join(keep)
     else:
-        lines = []
-    
-    # Append new config
-    lines.append("\n# Google Cloud Configuration (Auto-generated by setup_gcp.py)\n")
-    lines.append(f"GOOGLE_CLOUD_PROJECT={project_id}\n")
-    lines.append(f"GOOGLE_APPLICATION_CREDENTIALS=./gcp-credentials.json\n")
-    lines.append(f"GOOGLE_API_KEY={gemini_key}\n")
-    
-    with open(env_path, 'w') as f:
-        f.writelines(lines)
-    
+        body = ""
+
+    # Append new config and write in one buffered call
+    body += (
+        "\n# Google Cloud Configuration (Auto-generated by setup_gcp.py)\n"
+        f"GOOGLE_CLOUD_PROJECT={project_id}\n"
+        f"GOOGLE_APPLICATION_CREDENTIALS=./gcp-credentials.json\n"
+        f"GOOGLE_API_KEY={gemini_key}\n"
+    )
+    env_path.write_text(body)
+
     print("✅ .env file updated")
     print()
     
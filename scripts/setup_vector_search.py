@@ -166,17 +166,17 @@ def populate_initial_tactics(index_resource_name: str):
         },
     ]
     
-    # Generate embeddings
+    # Generate embeddings — one batched API call for all tactics instead of
+    # one round-trip per tactic
     model = TextEmbeddingModel.from_pretrained("text-embedding-004")
-    
+    embeddings = model.get_embeddings([tactic["text"] for tactic in tactics])
+
     # Format data for upload
     datapoints = []
-    for tactic in tactics:
-        embedding = model.get_embeddings([tactic["text"]])[0].values
-        
+    for tactic, embedding in zip(tactics, embeddings):
         datapoint = {
             "id": tactic["id"],
-            "embedding": embedding,
+            "embedding": embedding.values,
             "metadata": {
                 "text": tactic["text"],
                 "category": tactic["category"],
@@ -185,17 +185,48 @@ def populate_initial_tactics(index_resource_name: str):
         }
         datapoints.append(datapoint)
     
-    # Save to GCS (required for Vertex AI Vector Search)
-    # Note: This requires setting up a GCS bucket
     logger.info(f"Generated {len(datapoints)} embeddings")
-    logger.info("💡 To complete setup:")
-    logger.info("   1. Upload datapoints to GCS bucket")
-    logger.info("   2. Update index with GCS path")
-    logger.info("   3. Set VECTOR_INDEX_ENDPOINT_ID in .env")
-    
+
+    # Save to GCS (required for Vertex AI Vector Search)
+    bucket_name = os.getenv("VECTOR_KB_BUCKET")
+    if bucket_name:
+        upload_datapoints_to_gcs(bucket_name, datapoints, index_resource_name)
+    else:
+        logger.info("💡 To complete setup:")
+        logger.info("   1. Set VECTOR_KB_BUCKET and re-run to upload automatically, or")
+        logger.info("      upload datapoints to a GCS bucket and update the index manually")
+        logger.info("   2. Set VECTOR_INDEX_ENDPOINT_ID in .env")
+
     return datapoints
 
 
+def upload_datapoints_to_gcs(bucket_name: str, datapoints: list, index_resource_name: str):
+    """
+    Upload all datapoints as one JSONL blob and point the index at it.
+
+    A single upload_from_string call pushes the whole batch in one HTTPS
+    round-trip instead of N tiny puts, and the index ingests the delta
+    directory in one update_embeddings call.
+    """
+    import json
+    from google.cloud import storage
+    from google.cloud.storage.retry import DEFAULT_RETRY
+
+    logger.info(f"☁️ Uploading {len(datapoints)} datapoints to gs://{bucket_name}...")
+
+    data = "\n".join(json.dumps(dp, ensure_ascii=False) for dp in datapoints)
+    bucket = storage.Client(project=PROJECT_ID).bucket(bucket_name)
+    bucket.blob("indexes/tactics.jsonl").upload_from_string(
+        data, content_type="application/json", retry=DEFAULT_RETRY, timeout=60
+    )
+    logger.info("✅ Uploaded indexes/tactics.jsonl")
+
+    logger.info("🔄 Updating index with uploaded embeddings...")
+    index = MatchingEngineIndex(index_resource_name)
+    index.update_embeddings(contents_delta_uri=f"gs://{bucket_name}/indexes/")
+    logger.info("✅ Index update started")
+
+
 def main():
     """Main setup workflow."""
     logger.info("=" * 60)
@@ -1,9 +1,39 @@
-import sys
-import os
-from pathlib import Path
-
-# Add the project root directory to sys.path
-# This assumes conftest.py is in /tests/ and project root is one level up
-project_root = Path(__file__).parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+import pytest
+
+# Project-root imports (agents.*) resolve via pythonpath = ["."] in
+# pyproject.toml, so no sys.path surgery is needed here.
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Runs the async tests on uvloop when it's installed.
+
+    uvloop's scheduler cuts per-await overhead versus the stdlib
+    selector loop; the await-heavy agent tests benefit directly. Falls
+    back to the default policy where uvloop is unavailable (Windows).
+    """
+    try:
+        import uvloop
+        return uvloop.EventLoopPolicy()
+    except ImportError:
+        import asyncio
+        return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
+def fake_redis():
+    """In-process Redis double with real TTL/list/blpop semantics.
+
+    One instance serves the whole session (construction is the expensive
+    part); per-test isolation comes from the autouse flush below.
+    """
+    import fakeredis.aioredis
+    return fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+async def redis_backed(fake_redis, monkeypatch):
+    """Points agents.shared.streaming_state at the fake client, flushed clean."""
+    await fake_redis.flushall()
+    monkeypatch.setattr("agents.shared.streaming_state.redis_client", fake_redis)
+    return fake_redis
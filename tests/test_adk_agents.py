@@ -2,11 +2,19 @@
 Tests for the ADK-based agent system.
 """
 import pytest
-from agents.adk_agents.munshi.agent import MunshiAgent
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def munshi_agent():
-    """Returns an instance of the MunshiAgent."""
+    """Returns a single MunshiAgent shared by the whole session.
+
+    Constructing the agent initializes Vertex clients and LLM sessions, so
+    a function-scoped fixture would pay that cost once per test. The tests
+    here are read-only against the agent, so sharing one instance is safe.
+
+    The import lives here rather than at module top so collection (and
+    xdist worker startup) doesn't pay for the agent's SDK imports.
+    """
+    from agents.adk_agents.munshi.agent import MunshiAgent
     return MunshiAgent()
 
 def test_trip_orchestration(munshi_agent):
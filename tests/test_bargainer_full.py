@@ -2,7 +2,7 @@
 Full Integration Tests for Bargainer Agent (Logic & Flow)
 """
 import pytest
-from unittest.mock import patch, MagicMock, AsyncMock
+from unittest.mock import patch, MagicMock
 from agents.adk_agents.bargainer.negotiation_brain import NegotiationBrain
 from agents.adk_agents.shared.custom_planners import NegotiationPlanner
 from agents.adk_agents.bargainer.agent import negotiation_loop
@@ -46,48 +46,53 @@ def test_negotiation_brain_prompt_construction(mock_genai_model):
 
 # --- 2. Test Negotiation Planner (Decision Logic) ---
 
-@pytest.mark.asyncio
-async def test_planner_ask_price_if_missing():
-    """Planner should ask for price if not yet quoted."""
-    planner = NegotiationPlanner()
-    context = {
-        "current_quote": None,
-        "market_rate": 2000,
-        "budget_max": 2500
-    }
-    plan = await planner.plan(context)
-    assert plan["action"] == "ask_price"
+@pytest.fixture(scope="module")
+def planner():
+    """One default-config planner shared by the module.
 
-@pytest.mark.asyncio
-async def test_planner_accept_deal():
-    """Planner should accept if quote is within budget."""
-    planner = NegotiationPlanner()
-    context = {
-        "current_quote": 2400,
-        "market_rate": 2000,
-        "budget_max": 2500
-    }
-    plan = await planner.plan(context)
-    assert plan["action"] == "accept"
-    assert "2400" in plan["message"]
+    The planner is stateless across plan() calls, so the tests can share
+    a single instance instead of rebuilding it per test.
+    """
+    return NegotiationPlanner()
 
-@pytest.mark.asyncio
-async def test_planner_counter_offer_stubborn():
-    """Planner should make small counter-offer for stubborn vendors."""
-    planner = NegotiationPlanner()
-    context = {
-        "current_quote": 3000,
-        "market_rate": 2000,
-        "budget_max": 2500,
-        "vendor_profile": {"negotiation_style": "stubborn"}
-    }
+@pytest.mark.parametrize(
+    "scenario, context, expected_action, expected_offer",
+    [
+        (
+            "ask_price_if_missing",
+            {"current_quote": None, "market_rate": 2000, "budget_max": 2500},
+            "ask_price",
+            None,
+        ),
+        (
+            "accept_within_budget",
+            {"current_quote": 2400, "market_rate": 2000, "budget_max": 2500},
+            "accept",
+            None,
+        ),
+        (
+            "counter_stubborn_vendor",
+            {
+                "current_quote": 3000,
+                "market_rate": 2000,
+                "budget_max": 2500,
+                "vendor_profile": {"negotiation_style": "stubborn"},
+            },
+            "counter",
+            2850.0,  # 3000 * 0.95
+        ),
+    ],
+)
+async def test_planner_decisions(planner, scenario, context, expected_action, expected_offer):
+    """Planner picks the right action for each negotiation situation."""
     plan = await planner.plan(context)
-    
-    assert plan["action"] == "counter"
-    # 3000 * 0.95 = 2850
-    assert plan["offer"] == 2850.0 
 
-@pytest.mark.asyncio
+    assert plan["action"] == expected_action, scenario
+    if expected_action == "accept":
+        assert str(int(context["current_quote"])) in plan["message"]
+    if expected_offer is not None:
+        assert plan["offer"] == expected_offer
+
 async def test_planner_end_call_max_rounds():
     """Planner should end call if max rounds reached."""
     planner = NegotiationPlanner(max_rounds=5)
@@ -101,14 +106,12 @@ async def test_planner_end_call_max_rounds():
 
 # --- 3. Test Negotiation Loop Agent (Integration) ---
 
-@pytest.mark.asyncio
-@patch('agents.adk_agents.bargainer.atomic_tools.send_message')
-@patch('agents.adk_agents.bargainer.atomic_tools._get_call_state')
-async def test_negotiation_loop_flow(mock_get_state, mock_send_message):
+async def test_negotiation_loop_flow():
     """
-    Test the loop agent flow. 
-    Note: Testing ADK loop execution requires mocking the runner or engine, 
+    Test the loop agent flow.
+    Note: Testing ADK loop execution requires mocking the runner or engine,
     which is complex. Here we verify the agent configuration and tool chain.
+    (No tools are invoked, so nothing needs patching.)
     """
     # Verify sub-agent
     turn_agent = negotiation_loop.sub_agents[0]
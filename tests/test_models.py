@@ -0,0 +1,77 @@
+"""
+Tests for the shared Pydantic models (agents/shared/models.py)
+"""
+from datetime import datetime
+
+import pytest
+from pydantic import ValidationError
+from agents.shared.models import AgentUpdate, Call, CallStatus, Trip, TripStatus, Vendor
+
+# Fixed instant used wherever a test needs a timestamp — keeps
+# serialization output deterministic without freezing the clock.
+FROZEN_NOW = datetime(2024, 12, 20, 10, 0, 0)
+
+
+def make_trip(**overrides):
+    defaults = dict(
+        user_id="user_789",
+        destination="Goa",
+        start_date="2024-12-20",
+        end_date="2024-12-24",
+        party_size=4,
+        budget_min=20000.0,
+        budget_max=30000.0,
+        budget_stretch=32000.0,
+        services=["taxi", "homestay"],
+    )
+    defaults.update(overrides)
+    return Trip(**defaults)
+
+
+def test_trip_serialization_roundtrip():
+    """A trip survives model_dump_json -> model_validate_json unchanged."""
+    trip = make_trip(status=TripStatus.NEGOTIATING)
+    restored = Trip.model_validate_json(trip.model_dump_json())
+    assert restored == trip
+    assert restored.status is TripStatus.NEGOTIATING
+
+
+def test_models_are_frozen():
+    """Shared models reject mutation after construction."""
+    trip = make_trip()
+    with pytest.raises(ValidationError):
+        trip.destination = "Manali"
+
+
+def test_mutable_defaults_are_independent():
+    """default_factory fields must not share state between instances."""
+    call_a = Call(trip_id="trip_1", vendor_id="vendor_1")
+    call_b = Call(trip_id="trip_2", vendor_id="vendor_2")
+    assert call_a.transcript is not call_b.transcript
+    assert call_a.status is CallStatus.INITIATED
+
+
+def test_agent_update_with_pinned_timestamp():
+    """Passing timestamp explicitly yields byte-identical serialization."""
+    update = AgentUpdate(
+        trip_id="trip_123",
+        agent="bargainer",
+        state="negotiating",
+        message="Round 2 complete",
+        timestamp=FROZEN_NOW,
+    )
+    assert update.model_dump()["timestamp"] == FROZEN_NOW
+    assert update.model_dump_json() == AgentUpdate(**update.model_dump()).model_dump_json()
+
+
+def test_vendor_ignores_unknown_fields():
+    """extra='ignore' drops unexpected keys from upstream payloads."""
+    vendor = Vendor(
+        phone="+919876543210",
+        name="Test Vendor",
+        category="taxi",
+        location="Goa",
+        source="justdial",
+        unexpected_field="dropped",
+    )
+    assert not hasattr(vendor, "unexpected_field")
@@ -2,7 +2,7 @@
 Tests for the refactored ADK agents (Parallel-Sequential Scout and Loop-Based Bargainer)
 """
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 from agents.adk_agents.scout.agent import scout_agent, parallel_search_agent
 from agents.adk_agents.bargainer.agent import bargainer_agent, negotiation_loop, negotiation_turn_agent
 from agents.adk_agents.bargainer import atomic_tools
@@ -59,18 +59,37 @@ def test_negotiation_turn_agent_tools():
 
 # --- Atomic Tool Tests with Mocks ---
 
-@patch('agents.adk_agents.bargainer.atomic_tools._save_call_state')
-@patch('agents.adk_agents.bargainer.atomic_tools._push_to_redis_queue_sync')
-@patch('agents.adk_agents.bargainer.atomic_tools.generate_and_store_sarvam_audio')
-@patch('agents.adk_agents.bargainer.atomic_tools._get_twilio_client')
-def test_atomic_tool_initiate_call(mock_twilio, mock_sarvam, mock_redis, mock_save_state):
+_STATE_HELPERS = (
+    "_get_call_state",
+    "_save_call_state",
+    "_delete_call_state",
+    "_push_to_redis_queue_sync",
+    "generate_and_store_sarvam_audio",
+    "_get_twilio_client",
+)
+
+@pytest.fixture
+def tool_stubs(monkeypatch):
+    """Stubs every atomic_tools state/IO helper in one pass.
+
+    Replaces the per-test stacks of @patch decorators; tests just set
+    return_value on the stub they care about.
+    """
+    stubs = {}
+    for name in _STATE_HELPERS:
+        stub = MagicMock()
+        monkeypatch.setattr(atomic_tools, name, stub)
+        stubs[name] = stub
+    return stubs
+
+def test_atomic_tool_initiate_call(tool_stubs):
     """Test the initiate_call atomic tool with mocks."""
-    mock_sarvam.return_value = "http://mock/audio.wav"
-    
+    tool_stubs["generate_and_store_sarvam_audio"].return_value = "http://mock/audio.wav"
+
     mock_call = MagicMock()
     mock_call.sid = "CA12345"
-    mock_twilio.return_value.calls.create.return_value = mock_call
-    
+    tool_stubs["_get_twilio_client"].return_value.calls.create.return_value = mock_call
+
     vendor = {
         "name": "Test Vendor",
         "phone": "+919876543210",
@@ -88,13 +107,11 @@ def test_atomic_tool_initiate_call(mock_twilio, mock_sarvam, mock_redis, mock_sa
     assert result["vendor_name"] == "Test Vendor"
     assert result["status"] == "CALL_INITIATED"
     assert result["twilio_call_sid"] == "CA12345"
-    
-    mock_save_state.assert_called()
-    mock_sarvam.assert_called()
 
-@patch('agents.adk_agents.bargainer.atomic_tools._get_call_state')
-@patch('agents.adk_agents.bargainer.atomic_tools._save_call_state')
-def test_atomic_tool_send_message(mock_save_state, mock_get_state):
+    tool_stubs["_save_call_state"].assert_called()
+    tool_stubs["generate_and_store_sarvam_audio"].assert_called()
+
+def test_atomic_tool_send_message(tool_stubs):
     """Test the send_message atomic tool."""
     # Mock state return
     call_id = "call_+919876543210"
@@ -103,8 +120,8 @@ def test_atomic_tool_send_message(mock_save_state, mock_get_state):
         "history": [],
         "current_quote": None
     }
-    mock_get_state.return_value = mock_state
-    
+    tool_stubs["_get_call_state"].return_value = mock_state
+
     # Send a message
     result = atomic_tools.send_message(call_id, "Thoda kam kar dijiye", offer=2800.0)
     
@@ -112,48 +129,52 @@ def test_atomic_tool_send_message(mock_save_state, mock_get_state):
     assert "vendor_response" in result
     assert "current_quote" in result
     assert result["round"] == 1
-    assert mock_save_state.called
+    assert tool_stubs["_save_call_state"].called
 
-@patch('agents.adk_agents.bargainer.atomic_tools._get_call_state')
-@patch('agents.adk_agents.bargainer.atomic_tools._delete_call_state')
-def test_atomic_tool_accept_deal(mock_delete_state, mock_get_state):
+def test_atomic_tool_accept_deal(tool_stubs):
     """Test the accept_deal atomic tool."""
     call_id = "call_+919876543210"
     mock_state = {
         "vendor": {"name": "Test Vendor", "phone": "+91...", "category": "taxi"},
         "round": 3
     }
-    mock_get_state.return_value = mock_state
-    
+    tool_stubs["_get_call_state"].return_value = mock_state
+
     # Accept the deal
     result = atomic_tools.accept_deal(call_id, 2900.0)
-    
-    assert result["vendor_name"] == "Test Vendor"
-    assert result["negotiated_price"] == 2900.0
-    assert result["status"] == "DEAL_SUCCESS"
-    assert mock_delete_state.called
 
-@patch('agents.adk_agents.bargainer.atomic_tools._get_call_state')
-@patch('agents.adk_agents.bargainer.atomic_tools._delete_call_state')
-def test_atomic_tool_end_call(mock_delete_state, mock_get_state):
+    # One structural comparison documents the full deal payload
+    assert result == {
+        "vendor_name": "Test Vendor",
+        "phone": "+91...",
+        "service_type": "taxi",
+        "negotiated_price": 2900.0,
+        "status": "DEAL_SUCCESS",
+    }
+    assert tool_stubs["_delete_call_state"].called
+
+def test_atomic_tool_end_call(tool_stubs):
     """Test the end_call atomic tool with escalation."""
     call_id = "call_+919876543210"
     mock_state = {
         "vendor": {"name": "Test Vendor", "phone": "+91...", "category": "taxi"},
     }
-    mock_get_state.return_value = mock_state
-    
+    tool_stubs["_get_call_state"].return_value = mock_state
+
     # Mock tool context
     mock_context = MagicMock()
     mock_context.actions = MagicMock()
     
     # End the call
     result = atomic_tools.end_call(mock_context, call_id, "max_rounds_reached")
-    
-    assert result["status"] == "CALL_ENDED"
-    assert result["reason"] == "max_rounds_reached"
+
+    assert result == {
+        "call_id": call_id,
+        "status": "CALL_ENDED",
+        "reason": "max_rounds_reached",
+    }
     assert mock_context.actions.escalate == True
-    assert mock_delete_state.called
+    assert tool_stubs["_delete_call_state"].called
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
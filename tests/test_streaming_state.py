@@ -0,0 +1,30 @@
+"""
+Tests for the Redis-backed streaming call queue (agents/shared/streaming_state.py)
+"""
+import pytest
+from agents.shared import streaming_state
+
+
+async def test_push_and_pop_roundtrip(redis_backed):
+    """Pushed text comes back in FIFO order with a TTL on the queue."""
+    await streaming_state.push_to_queue("call_123", "Namaste bhaiya")
+    await streaming_state.push_to_queue("call_123", "Rate kya hai?")
+
+    assert await streaming_state.pop_from_queue("call_123", timeout=1) == "Namaste bhaiya"
+    assert await streaming_state.pop_from_queue("call_123", timeout=1) == "Rate kya hai?"
+
+    # Auto-cleanup expiry was set by the push pipeline
+    await streaming_state.push_to_queue("call_123", "theek hai")
+    assert await redis_backed.ttl("call_queue:call_123") > 0
+
+
+async def test_pop_empty_queue_returns_none(redis_backed):
+    """Popping a queue nobody wrote to times out with None."""
+    assert await streaming_state.pop_from_queue("call_missing", timeout=1) is None
+
+
+async def test_clear_call_queue(redis_backed):
+    """Clearing drops any pending messages for the call."""
+    await streaming_state.push_to_queue("call_456", "pending")
+    await streaming_state.clear_call_queue("call_456")
+    assert await redis_backed.exists("call_queue:call_456") == 0